@@ -3,10 +3,20 @@ from collections import defaultdict
 import decimal
 from decimal import Decimal
 from enum import Enum
-from math import floor, ceil, trunc, copysign, modf, fmod, fabs, isfinite, isnan
+from fractions import Fraction
+from functools import lru_cache
+from math import floor, ceil, trunc, copysign, modf, fmod, fabs, isfinite
 from numbers import Integral, Real, Number, Complex, Rational
 from typing import Callable, Dict
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# type to test for NumPy array inputs; an empty tuple matches nothing when NumPy isn't available
+_ndarray = () if np is None else np.ndarray
+
 # all we need for `import *`
 __all__ = ['Rounder', 'RoundingMode']
 
@@ -29,6 +39,10 @@ class RoundingMode(Enum):
     ROUNDHALFFROMZERO = 'Round to nearest decimal with ties going toward +infinity if positive and toward -infinity if negative'
     ROUND05FROMZERO = 'Round toward zero, unless the rounded number ends in 0 or 5, in which case round toward +infinity if positive and toward -infinity if negative'
 
+    # members are only equal to themselves, so the identity hash is consistent with equality; it is computed in C, unlike `Enum.__hash__`
+    # which hashes the member name in Python and so more than triples the cost of the dictionary lookups made by every rounding
+    __hash__ = object.__hash__
+
 
 def _sign(x: Real | Decimal) -> Integral:
     """Signum function.
@@ -42,18 +56,22 @@ def _sign(x: Real | Decimal) -> Integral:
     -1
     >>> _sign(-0.0)
     0
+    >>> _sign(-10**400)
+    -1
 
     Takes signed `NaN` and signed `Inf` also and returns the sign.
 
     Complex valued inputs raise an error.
     """
-    # in general this is faster than `return 0 if x == 0 else int(copysign(1.0, x))` but 
+    # in general this is faster than `return 0 if x == 0 else int(copysign(1.0, x))` but
     # this doesn't work in the default context of `Decimal('NaN')` which traps comparisons `>`, `<`
     # as invalid operations:
     # return 0 if x == 0 else 1 if x > 0 else -1 if x < 0 else int(copysign(1.0, x))
 
-    # this is a compromise between the two
-    return int(copysign(1.0, x)) if isnan(x) else 1 if x > 0 else -1 if x < 0 else 0
+    # this is a compromise between the two, masking out NaN first with `x != x`, which is true only for NaN and
+    # which `Decimal('NaN')` doesn't trap; it is cheaper than calling `isnan`, and also avoids converting
+    # non-NaN `x` to `float`, which overflows for very large `int` and `Fraction` values
+    return int(copysign(1.0, x)) if x != x else 1 if x > 0 else -1 if x < 0 else 0
 
 
 def _awayfromzero(x: Real | Decimal) -> Integral:
@@ -108,7 +126,13 @@ def _roundhalftozero(x: Real | Decimal) -> Integral:
     >>> _roundhalftozero(-0.5)
     0
     """
-    return _sign(x) * ceil((2 * abs(x) - 1) / 2)
+    # `2 * x + 1` is inexact for a `float` near `2**53`, so floats are rounded exactly as in `_roundhalftozero_float` instead, with the
+    # sign of `x` as a branch; Inf and NaN raise the same errors from `int` as from `floor` and `ceil`
+    if isinstance(x, float):
+        return (floor(x + 0.5) if x < 0 else ceil(x - 0.5)) if fabs(x) < _FLOAT_INTEGRAL_BOUND else int(x)
+    # branching on the sign of `x` saves the `_sign` call, `abs` and the multiplication; `x != x` masks out NaN first since the comparison
+    # `x < 0` traps for `Decimal('NaN')` in the default context, as in `_sign`
+    return floor((2 * x + 1) / 2) if x != x or x < 0 else ceil((2 * x - 1) / 2)
 
 
 def _roundhalffromzero(x: Real | Decimal) -> Integral:
@@ -132,7 +156,10 @@ def _roundhalffromzero(x: Real | Decimal) -> Integral:
     >>> _roundhalffromzero(-0.5)
     -1
     """
-    return _sign(x) * floor((2 * abs(x) + 1) / 2)
+    # see `_roundhalftozero`, and `_roundhalffromzero_float`
+    if isinstance(x, float):
+        return (ceil(x - _FLOAT_BELOW_HALF) if x < 0 else floor(x + _FLOAT_BELOW_HALF)) if fabs(x) < _FLOAT_INTEGRAL_BOUND else int(x)
+    return ceil((2 * x - 1) / 2) if x != x or x < 0 else floor((2 * x + 1) / 2)
 
 
 def _roundhalfdown(x: Real | Decimal) -> Integral:
@@ -156,6 +183,9 @@ def _roundhalfdown(x: Real | Decimal) -> Integral:
     >>> _roundhalfdown(-0.5)
     -1
     """
+    # see `_roundhalftozero`, and `_roundhalfdown_float`
+    if isinstance(x, float):
+        return ceil(x - (_FLOAT_BELOW_HALF if x < 0 else 0.5)) if fabs(x) < _FLOAT_INTEGRAL_BOUND else int(x)
     return ceil((2 * x - 1) / 2)
 
 
@@ -179,7 +209,12 @@ def _roundhalfup(x: Real | Decimal) -> Integral:
     0
     >>> _roundhalfup(-0.5)
     0
+    >>> _roundhalfup(0.49999999999999994)
+    0
     """
+    # see `_roundhalftozero`, and `_roundhalfup_float`
+    if isinstance(x, float):
+        return floor(x + (_FLOAT_BELOW_HALF if x > 0 else 0.5)) if fabs(x) < _FLOAT_INTEGRAL_BOUND else int(x)
     return floor((2 * x + 1) / 2)
 
 
@@ -197,9 +232,18 @@ def _roundhalfodd(x: Real | Decimal) -> Integral:
     0
     >>> _roundhalfodd(0.0)
     0
+    >>> _roundhalfodd(1e16)
+    10000000000000000
+    >>> _roundhalfodd(1.5000000000000002)
+    2
     """
-    sgn_x = _sign(x)
-    return round(x + sgn_x) - sgn_x
+    # `x + 1` is inexact for a `float` near a power of two, e.g. for `x = 1.5000000000000002` or `x = 2.0**53`, so floats are rounded
+    # exactly as in `_roundhalfodd_float` instead, which also raises for Inf and NaN
+    if isinstance(x, float):
+        r = round(x)
+        return int(2.0 * x) - r if fabs(x - r) == 0.5 else r
+    # inlines `_sign` as a branch on the sign of `x`, as in `_roundhalftozero`; for `x == 0` either branch gives 0
+    return round(x - 1) + 1 if x != x or x < 0 else round(x + 1) - 1
 
 
 def _round05fromzero(x: Real | Decimal) -> Integral:
@@ -223,6 +267,14 @@ def _round05fromzero(x: Real | Decimal) -> Integral:
     return tozero_x if tozero_x % 5 else _awayfromzero(x)
 
 
+_FLOAT_INTEGRAL_BOUND = 2.0 ** 52
+"Every `float` with magnitude at least `2**52` is an integer, since its 53 bit significand has no bits left for a fractional part."
+
+_FLOAT_BELOW_HALF = 0.49999999999999994
+"""The largest `float` below one half, `0.5 - 2**-54`. For `0 <= y < _FLOAT_INTEGRAL_BOUND`, `floor(y + _FLOAT_BELOW_HALF)` rounds `y`
+half up exactly: from a half the sum rounds up to the next integer, while `floor(y + 0.5)` also rounds up `y = _FLOAT_BELOW_HALF`."""
+
+
 def _ceil_float(x: float) -> float:
     """As `ceil` but takes and returns `float`.
     Float signs, Inf and NaN are all preserved.
@@ -238,9 +290,12 @@ def _ceil_float(x: float) -> float:
     1.0
     >>> _ceil_float(-0.5) == -0.0 and copysign(1.0, _ceil_float(-0.5)) == -1.0
     True
+    >>> _ceil_float(10**20 + 1)
+    1e+20
     """
-    fpart, ipart = modf(x)
-    return ipart if copysign(1.0, fpart) == -1.0 or fpart == 0.0 else ipart + 1.0
+    # `ceil` returns an `int`, which `copysign` converts back to `float`, restoring the sign of zero; floats at least as large as
+    # `_FLOAT_INTEGRAL_BOUND` in magnitude, Inf and NaN are returned unchanged, and so are larger `int`s except for their conversion to `float`
+    return copysign(ceil(x), x) if fabs(x) < _FLOAT_INTEGRAL_BOUND else float(x)
 
 
 def _floor_float(x: float) -> float:
@@ -259,8 +314,8 @@ def _floor_float(x: float) -> float:
     >>> _floor_float(0.5) == 0.0 and copysign(1.0, _floor_float(0.5)) == 1.0
     True
     """
-    fpart, ipart = modf(x)
-    return ipart if copysign(1.0, fpart) == 1.0 or fpart == 0.0 else ipart - 1.0
+    # see `_ceil_float`
+    return copysign(floor(x), x) if fabs(x) < _FLOAT_INTEGRAL_BOUND else float(x)
 
 
 def _trunc_float(x: float) -> float:
@@ -281,8 +336,8 @@ def _trunc_float(x: float) -> float:
     >>> _trunc_float(0.5) == 0.0 and copysign(1.0, _trunc_float(0.5)) == 1.0
     True
     """
-    _, ipart = modf(x)
-    return ipart
+    # see `_ceil_float`
+    return copysign(trunc(x), x) if fabs(x) < _FLOAT_INTEGRAL_BOUND else float(x)
 
 
 def _awayfromzero_float(x: float) -> float:
@@ -299,8 +354,8 @@ def _awayfromzero_float(x: float) -> float:
     >>> _awayfromzero_float(1.0)
     1.0
     """
-    fpart, ipart = modf(x)
-    return ipart if fpart == 0.0 else ipart + copysign(1.0, fpart)
+    # see `_ceil_float`
+    return copysign(ceil(fabs(x)), x) if fabs(x) < _FLOAT_INTEGRAL_BOUND else float(x)
 
 
 def _roundhalfeven_float(x: float) -> float:
@@ -349,9 +404,18 @@ def _roundhalfodd_float(x: float) -> float:
     -1.0
     >>> _roundhalfodd_float(1.0)
     1.0
+    >>> _roundhalfodd_float(1.5000000000000002)
+    2.0
+    >>> _roundhalfodd_float(2.0 ** 53)
+    9007199254740992.0
     """
-    sgn_x = copysign(1.0, x)
-    return copysign(round(x + sgn_x, 0) - sgn_x, x)
+    # as in `_roundhalftozero_float`, `x` at least `_FLOAT_INTEGRAL_BOUND` in magnitude is already integral, as are Inf and NaN; below
+    # it `round` rounds half to even exactly, `x - r` is exact and so detects a half, and there the odd neighbour `2.0 * x - r` is exact
+    # too, whereas the sum `x + 1.0` would be inexact for e.g. `x = 1.5000000000000002` and make it a half
+    if fabs(x) < _FLOAT_INTEGRAL_BOUND:
+        r = round(x)
+        return copysign(2.0 * x - r if fabs(x - r) == 0.5 else r, x)
+    return float(x)
 
 
 def _roundhalftozero_float(x: float) -> float:
@@ -380,7 +444,10 @@ def _roundhalftozero_float(x: float) -> float:
     >>> _roundhalftozero_float(-0.5) == -0.0 and copysign(1.0, _roundhalftozero_float(-0.5)) == -1.0
     True
     """
-    return copysign(_ceil_float((2.0 * fabs(x) - 1.0) / 2.0), x)
+    # for `float`, `(2.0 * y - 1.0) / 2.0` rounds exactly as `y - 0.5` does, since doubling and halving are exact, except that `2.0 * y`
+    # overflows to infinity for `y` near the largest `float`; `y - 0.5` is exact for `y = fabs(x)` below `_FLOAT_INTEGRAL_BOUND`, and odd `x`
+    # just above it would round to even, but there `x` is already integral, as are Inf and NaN, so `x` is returned as a `float`
+    return copysign(ceil(fabs(x) - 0.5), x) if fabs(x) < _FLOAT_INTEGRAL_BOUND else float(x)
 
 
 def _roundhalffromzero_float(x: float) -> float:
@@ -409,7 +476,8 @@ def _roundhalffromzero_float(x: float) -> float:
     >>> _roundhalffromzero_float(-0.5)
     -1.0
     """
-    return copysign(_floor_float((2.0 * fabs(x) + 1.0) / 2.0), x)
+    # see `_roundhalftozero_float`, and `_roundhalfup_float` for `_FLOAT_BELOW_HALF`
+    return copysign(floor(fabs(x) + _FLOAT_BELOW_HALF), x) if fabs(x) < _FLOAT_INTEGRAL_BOUND else float(x)
 
 
 def _roundhalfdown_float(x: float) -> float:
@@ -438,7 +506,8 @@ def _roundhalfdown_float(x: float) -> float:
     >>> _roundhalfdown_float(-0.5)
     -1.0
     """
-    return copysign(_ceil_float((2.0 * x - 1.0) / 2.0), x)
+    # see `_roundhalftozero_float`, and `_roundhalfup_float`, of which this is the mirror image
+    return copysign(ceil(x - (_FLOAT_BELOW_HALF if x < 0 else 0.5)), x) if fabs(x) < _FLOAT_INTEGRAL_BOUND else float(x)
 
 
 def _roundhalfup_float(x: float) -> float:
@@ -466,8 +535,13 @@ def _roundhalfup_float(x: float) -> float:
     True
     >>> _roundhalfup_float(-0.5) == -0.0 and copysign(1.0, _roundhalfup_float(-0.5)) == -1.0
     True
+    >>> _roundhalfup_float(0.49999999999999994)
+    0.0
     """
-    return copysign(_floor_float((2.0 * x + 1.0) / 2.0), x)
+    # see `_roundhalftozero_float`; but unlike `fabs(x) - 0.5`, the sum `x + 0.5` is inexact for `0.25 < x < 0.5`, and rounds up to `1.0`
+    # for `x = 0.49999999999999994`; adding `_FLOAT_BELOW_HALF` to positive `x` instead rounds up only from a half or more, while for
+    # negative `x` the sum `x + 0.5` doesn't round across an integer
+    return copysign(floor(x + (_FLOAT_BELOW_HALF if x > 0 else 0.5)), x) if fabs(x) < _FLOAT_INTEGRAL_BOUND else float(x)
 
 
 def _round05fromzero_float(x: float) -> float:
@@ -504,6 +578,10 @@ def _round05fromzero_float(x: float) -> float:
     return ipart if fpart == 0.0 or fmod(ipart, 5.0) else ipart + copysign(1.0, fpart)
 
 
+_DEC_ONE = Decimal(1)
+"`Decimal(1)`, made once since constructing a `Decimal` on every call of the `Decimal` rounding functions is comparatively slow."
+
+
 def _roundhalfodd_decimal(x: Decimal) -> Decimal:
     """Like `round(x, 0)`, but rounds half to the nearest odd integer instead of even integer, taking and returning `Decimal`.
     Decimal signs, Inf and NaN are all preserved.
@@ -526,7 +604,7 @@ def _roundhalfodd_decimal(x: Decimal) -> Decimal:
     >>> _roundhalfodd_decimal(Decimal('1.0'))
     Decimal('1')
     """
-    sgn_x = Decimal(1).copy_sign(x)
+    sgn_x = _DEC_ONE.copy_sign(x)
     return ((x + sgn_x).to_integral_value(decimal.ROUND_HALF_EVEN) - sgn_x).copy_sign(x)
 
 
@@ -577,8 +655,196 @@ def _roundhalfupdown_decimal(x: Decimal, direction: Decimal | int) -> Decimal:
     >>> _roundhalfupdown_decimal(Decimal('-0.5'), -1)
     Decimal('-1')
     """
-    sgn_x = Decimal(1).copy_sign(x) * Decimal(1).copy_sign(direction)
-    return x.to_integral_value(decimal.ROUND_HALF_DOWN if sgn_x < 0 else decimal.ROUND_HALF_UP)
+    # the product of the signs of `x` and `direction` is negative exactly when one of them is; `is_signed` reads the sign bit, also of
+    # signed zeros and NaNs, without making any `Decimal`s
+    return x.to_integral_value(decimal.ROUND_HALF_DOWN if x.is_signed() != (direction < 0) else decimal.ROUND_HALF_UP)
+
+
+@lru_cache(maxsize=None)
+def _float_integral_bound(dtype: 'np.dtype') -> float:
+    """The NumPy counterpart of `_FLOAT_INTEGRAL_BOUND` for the float dtype `dtype`: every element of magnitude at least this bound is
+    an integer. Cached, since `np.finfo` is comparatively slow.
+
+    #### Examples
+    >>> _float_integral_bound(np.dtype(np.float64)) == _FLOAT_INTEGRAL_BOUND
+    True
+    >>> _float_integral_bound(np.dtype(np.float32))
+    8388608.0
+    """
+    return 2.0 ** np.finfo(dtype).nmant
+
+
+def _roundhalfodd_float_array(a: 'np.ndarray') -> 'np.ndarray':
+    """As `_roundhalfodd_float` but vectorized over a NumPy float array, taking and returning `np.ndarray`.
+    Float signs, Inf and NaN are all preserved.
+
+    #### Examples
+    >>> _roundhalfodd_float_array(np.array([-3.5, -2.5, -0.5, 0.5, 2.5, 5.6]))
+    array([-3., -3., -1.,  1.,  3.,  6.])
+    >>> np.copysign(1.0, _roundhalfodd_float_array(np.array([-0.25, 0.25])))
+    array([-1.,  1.])
+    >>> _roundhalfodd_float_array(np.array([1.5000000000000002, 2.0 ** 53])).tolist()
+    [2.0, 9007199254740992.0]
+    >>> _roundhalfodd_float_array(np.array([2.0 ** 24 + 2], np.float32)).tolist()
+    [16777218.0]
+    """
+    # as in `_roundhalfodd_float`, but `rint` is exact for every element, and an infinite element makes `a - r` an invalid NaN which
+    # isn't a half, so no elements need masking out
+    with np.errstate(invalid='ignore'):
+        r = np.rint(a)
+        d = a - r
+        return np.copysign(np.where(np.abs(d) == 0.5, r + 2 * d, r), a)[()]
+
+
+def _roundhalf_float_array(a: 'np.ndarray', rounding: Callable, offset: float, absolute: bool) -> 'np.ndarray':
+    """Computes `np.copysign(rounding(b + offset), a)` over the NumPy float array `a`, where `b` is `np.abs(a)` if `absolute` and is `a`
+    otherwise, `rounding` is `np.floor` or `np.ceil` and `offset` is `0.5` or `-0.5`. This vectorizes the `_roundhalf*_float` functions.
+    The operations are done in place in a single result array, rather than allocating a temporary array for each, which is over twice as
+    fast for large `a`. Float signs, Inf and NaN are all preserved, and as in the `_roundhalf*_float` functions elements of `a` which are
+    already integral because of their magnitude are returned unchanged. The bound is `2.0 ** np.finfo(dtype).nmant` for the float
+    dtype of the result, which is `_FLOAT_INTEGRAL_BOUND` for `float64` but only `2.0 ** 23` for `float32`.
+
+    #### Examples
+    >>> _roundhalf_float_array(np.array([-2.5, -0.5, 0.5, 1.5]), np.floor, 0.5, False)
+    array([-2., -0.,  1.,  2.])
+    >>> _roundhalf_float_array(np.array([-2.5, -0.5, 0.5, 1.5]), np.ceil, -0.5, True)
+    array([-2., -0.,  0.,  1.])
+    >>> _roundhalf_float_array(np.array(2.5), np.floor, 0.5, True)
+    np.float64(3.0)
+    >>> _roundhalf_float_array(np.array([4503599627370497.0]), np.floor, 0.5, False)
+    array([4.50359963e+15])
+    >>> _roundhalf_float_array(np.array([8388609.0], np.float32), np.floor, 0.5, False).tolist()
+    [8388609.0]
+    >>> _roundhalf_float_array(np.array([-0.49999999999999994, 0.49999999999999994]), np.floor, 0.5, True).tolist()
+    [-0.0, 0.0]
+    """
+    t = np.empty(np.shape(a), np.result_type(a, 1.0))
+    integral = np.abs(a, out=t) >= _float_integral_bound(t.dtype)
+    b = t if absolute else a
+    # as in `_roundhalfup_float`, `b + offset` rounds up to the next integer for just one `b` below a half, the float next to `offset`
+    # toward zero, as `0.49999999999999994 + 0.5 == 1.0`; masking that out is cheaper than adding it in place of `offset` by sign
+    edge = b == np.nextafter(t.dtype.type(offset), t.dtype.type(0))
+    np.add(b, offset, out=t)
+    rounding(t, out=t)
+    np.copyto(t, 0.0, where=edge)
+    np.copysign(t, a, out=t)
+    np.copyto(t, a, where=integral)
+    # a 0-d `a` gives a NumPy scalar, as the ufuncs themselves do
+    return t if t.ndim else t[()]
+
+
+def _round05fromzero_float_array(a: 'np.ndarray') -> 'np.ndarray':
+    """As `_round05fromzero_float` but vectorized over a NumPy float array, taking and returning `np.ndarray`.
+    Float signs, Inf and NaN are all preserved.
+
+    #### Examples
+    >>> _round05fromzero_float_array(np.array([5.0000000000001, 4.9999999999999, 5.0, -9.9999999999999, -10.0000000000001, -7.5]))
+    array([  6.,   4.,   5.,  -9., -11.,  -7.])
+    >>> _round05fromzero_float_array(np.array([float('Inf'), float('-Inf')]))
+    array([ inf, -inf])
+    >>> _round05fromzero_float_array(np.array(5.5))
+    np.float64(6.0)
+    """
+    fpart, ipart = np.modf(a)
+    # `fmod` of an infinite integer part is an invalid operation, but infinite inputs have zero fractional part anyway
+    with np.errstate(invalid='ignore'):
+        keep = (fpart == 0.0) | (np.fmod(ipart, 5.0) != 0.0)
+    # a 0-d `a` gives a NumPy scalar, as in `_roundhalf_float_array`
+    return np.where(keep, ipart, ipart + np.copysign(1.0, fpart))[()]
+
+
+def _isinteger_float_array(a: 'np.ndarray') -> 'np.ndarray':
+    """As `float.is_integer` but vectorized over a NumPy float array, returning a boolean array. `fmod` is exact, and gives NaN for Inf
+    and NaN elements, so a single comparison covers them too.
+
+    #### Examples
+    >>> _isinteger_float_array(np.array([3.0, -0.0, 2.5, 2.0**60, float('Inf'), float('NaN')]))
+    array([ True,  True, False,  True, False, False])
+    """
+    with np.errstate(invalid='ignore'):
+        return np.fmod(a, 1.0) == 0.0
+
+
+def _to_int64_array(f: Callable[['np.ndarray'], 'np.ndarray']) -> Callable[['np.ndarray'], 'np.ndarray']:
+    """Convert `Callable` `f` from a function on NumPy float arrays returning integral floats to one returning a NumPy `int64` array.
+    As for `int` on a `float`, a NaN element raises `ValueError` and an infinite element raises `OverflowError`, and so does an element
+    outside the range of `int64`.
+
+    #### Examples
+    >>> _to_int64_array(np.floor)(np.array([-2.5, -0.0, 3.7]))
+    array([-3,  0,  3])
+    >>> _to_int64_array(np.floor)(np.array([1.0, float('NaN')]))
+    Traceback (most recent call last):
+      ...
+    ValueError: cannot convert float NaN to integer
+    >>> _to_int64_array(np.floor)(np.array([float('-Inf')]))
+    Traceback (most recent call last):
+      ...
+    OverflowError: cannot convert float infinity to integer
+    >>> _to_int64_array(np.floor)(np.array([2.0 ** 63]))
+    Traceback (most recent call last):
+      ...
+    OverflowError: float too large to convert to int64
+    """
+    def to_int64(a):
+        b = f(a)
+        # a single pass to check every element is in range, which is also false for NaN; the cause is only looked for on failure
+        if not ((b >= -2.0 ** 63) & (b < 2.0 ** 63)).all():
+            if np.isnan(b).any():
+                raise ValueError("cannot convert float NaN to integer")
+            if np.isinf(b).any():
+                raise OverflowError("cannot convert float infinity to integer")
+            raise OverflowError("float too large to convert to int64")
+        return b.astype(np.int64)
+    return to_int64
+
+
+@lru_cache(maxsize=None)
+def _import_rounder_numba():
+    """Returns the optional module `_rounder_numba` of Numba compiled rounding kernels, importing it on first use so as not to slow
+    down importing this module, or returns `None` when Numba isn't installed.
+    """
+    try:
+        if __package__:
+            from . import _rounder_numba
+        else:
+            # run as a script, for the doctests
+            import _rounder_numba
+    except ImportError:
+        return None
+    return _rounder_numba
+
+
+def _identity_on_int(f: Callable[[Real], Integral]) -> Callable[[Real], Integral]:
+    """Convert `Callable` `f` rounding `Real` numbers to integers into one that returns `int` inputs unchanged, since every rounding mode
+    rounds an integer to itself.
+
+    #### Examples
+    >>> _identity_on_int(_round05fromzero)(10**30)
+    1000000000000000000000000000000
+    >>> _identity_on_int(_round05fromzero)(5.5)
+    6
+    """
+    return lambda x: x if type(x) is int else f(x)
+
+
+def _on_int_quotient(f: Callable[[int, int, int], int]) -> Callable[[int, int], int]:
+    """Convert `Callable` `f` into a function rounding the quotient `x / u` of `int`s `x` and `u` exactly, without a `float` division.
+    `f(q, r, u)` must round `q + r / u`, where `q, r = divmod(x, u)` for positive `u`, so that `0 <= r < u`. A zero `u` raises
+    `ZeroDivisionError`.
+
+    #### Examples
+    >>> _on_int_quotient(lambda q, r, u: q + (r > 0))(10**20 + 1, 2)
+    50000000000000000001
+    >>> _on_int_quotient(lambda q, r, u: q + (r > 0))(7, -2)
+    -3
+    """
+    def on_int_quotient(x: int, u: int) -> int:
+        if u < 0:
+            x, u = -x, -u
+        q, r = divmod(x, u)
+        return f(q, r, u)
+    return on_int_quotient
 
 
 def _apply_to_real_part(f: Callable[[Real], Number]) -> Callable[[Complex], Number]:
@@ -589,7 +855,7 @@ def _apply_to_real_part(f: Callable[[Real], Number]) -> Callable[[Complex], Numb
     >>> _sign(3.2 + 1j)
     Traceback (most recent call last):
       ...
-    TypeError: must be real number, not complex
+    TypeError: '>' not supported between instances of 'complex' and 'int'
 
     >>> _apply_to_real_part(_sign)(3.2 + 1j)
     1
@@ -638,6 +904,50 @@ class Rounder():
     }
     "Map of `RoundingMode`s to functions from `Real` or `Decimal` to `Integral`." 
 
+    _int_to_integral = {
+        **_real_to_integral,
+        RoundingMode.ROUNDFROMZERO: _identity_on_int(_awayfromzero),
+        RoundingMode.ROUNDHALFODD: _identity_on_int(_roundhalfodd),
+        RoundingMode.ROUNDHALFDOWN: _identity_on_int(_roundhalfdown),
+        RoundingMode.ROUNDHALFUP: _identity_on_int(_roundhalfup),
+        RoundingMode.ROUNDHALFTOZERO: _identity_on_int(_roundhalftozero),
+        RoundingMode.ROUNDHALFFROMZERO: _identity_on_int(_roundhalffromzero),
+        RoundingMode.ROUND05FROMZERO: _identity_on_int(_round05fromzero),
+    }
+    """Map of `RoundingMode`s to functions from `Real` to `Integral`, for `int` `Rounder`s. As `_real_to_integral`, except that the functions
+    written in Python return `int` inputs unchanged instead of doing arithmetic on them. The builtin `floor`, `ceil`, `trunc` and `round` are
+    already fast on `int`s."""
+
+    _int_quotient_to_integral = _map_over_dict_vals(_on_int_quotient, {
+        RoundingMode.ROUNDDOWN: lambda q, r, u: q,
+        RoundingMode.ROUNDUP: lambda q, r, u: q + (r > 0),
+        RoundingMode.ROUNDTOZERO: lambda q, r, u: q + (r > 0 and q < 0),
+        RoundingMode.ROUNDFROMZERO: lambda q, r, u: q + (r > 0 and q >= 0),
+        # at a half, `2 * r == u`, and adding 1 to `2 * r` breaks the tie upward
+        RoundingMode.ROUNDHALFEVEN: lambda q, r, u: q + (2 * r + (q & 1) > u),
+        RoundingMode.ROUNDHALFODD: lambda q, r, u: q + (2 * r + (~q & 1) > u),
+        RoundingMode.ROUNDHALFDOWN: lambda q, r, u: q + (2 * r > u),
+        RoundingMode.ROUNDHALFUP: lambda q, r, u: q + (2 * r >= u),
+        RoundingMode.ROUNDHALFTOZERO: lambda q, r, u: q + (2 * r + (q < 0) > u),
+        RoundingMode.ROUNDHALFFROMZERO: lambda q, r, u: q + (2 * r + (q >= 0) > u),
+        # `q + (q < 0)` is the quotient rounded toward zero
+        RoundingMode.ROUND05FROMZERO: lambda q, r, u: q + ((q < 0) if (q + (q < 0)) % 5 else (q >= 0)) if r else q,
+    })
+    """Map of `RoundingMode`s to functions `(x, u) -> int` rounding the quotient `x / u` of two `int`s exactly, for `countunits` on `int`
+    `Rounder`s. The `float` quotient `x / u` would be inexact for large `x`."""
+
+    _decimal_to_integral = {
+        **_real_to_integral,
+        RoundingMode.ROUNDFROMZERO: lambda x: int(x.to_integral_value(decimal.ROUND_UP)),
+        RoundingMode.ROUNDHALFTOZERO: lambda x: int(x.to_integral_value(decimal.ROUND_HALF_DOWN)),
+        RoundingMode.ROUNDHALFFROMZERO: lambda x: int(x.to_integral_value(decimal.ROUND_HALF_UP)),
+        RoundingMode.ROUNDHALFDOWN: lambda x: int(_roundhalfupdown_decimal(x, -1)),
+        RoundingMode.ROUNDHALFUP: lambda x: int(_roundhalfupdown_decimal(x, 1))
+    }
+    """Map of `RoundingMode`s to functions from `Decimal` to `Integral`. As `_real_to_integral`, except where a `decimal` rounding mode
+    does the same rounding in one exact step, which is about twice as fast as the arithmetic of the `Real` functions. Half up and half
+    down rounding pick the `decimal` rounding mode from the sign of `x`, which still beats the `Real` functions' division by two."""
+
     _float_to_float = {
         RoundingMode.ROUNDDOWN: _floor_float,
         RoundingMode.ROUNDUP: _ceil_float,
@@ -653,6 +963,8 @@ class Rounder():
     }
     "Map of `RoundingMode`s to functions from `float` to `float`." 
 
+    # plain lambdas are the fastest way to call `to_integral_value` here: `functools.partial(Decimal.to_integral_value, rounding=...)` has
+    # to pass `rounding` by keyword and is over twice as slow, and `operator.methodcaller` is slower too
     _decimal_to_decimal = {
         RoundingMode.ROUNDDOWN: lambda x: x.to_integral_value(decimal.ROUND_FLOOR),
         RoundingMode.ROUNDUP: lambda x: x.to_integral_value(decimal.ROUND_CEILING),
@@ -660,14 +972,39 @@ class Rounder():
         RoundingMode.ROUNDFROMZERO: lambda x: x.to_integral_value(decimal.ROUND_UP),
         RoundingMode.ROUNDHALFEVEN: lambda x: x.to_integral_value(decimal.ROUND_HALF_EVEN),
         RoundingMode.ROUNDHALFODD: _roundhalfodd_decimal,
-        RoundingMode.ROUNDHALFDOWN: lambda x: _roundhalfupdown_decimal(x, Decimal(-1)),
-        RoundingMode.ROUNDHALFUP: lambda x: _roundhalfupdown_decimal(x, Decimal(1)),
+        RoundingMode.ROUNDHALFDOWN: lambda x: _roundhalfupdown_decimal(x, -1),
+        RoundingMode.ROUNDHALFUP: lambda x: _roundhalfupdown_decimal(x, 1),
         RoundingMode.ROUNDHALFTOZERO: lambda x: x.to_integral_value(decimal.ROUND_HALF_DOWN),
         RoundingMode.ROUNDHALFFROMZERO: lambda x: x.to_integral_value(decimal.ROUND_HALF_UP),
         RoundingMode.ROUND05FROMZERO: lambda x: x.to_integral_value(
             decimal.ROUND_05UP)
     }
-    "Map of `RoundingMode`s to functions from `Decimal` to `Decimal`." 
+    "Map of `RoundingMode`s to functions from `Decimal` to `Decimal`."
+
+    _float_to_float_array = {
+        RoundingMode.ROUNDDOWN: lambda a: np.floor(a),
+        RoundingMode.ROUNDUP: lambda a: np.ceil(a),
+        RoundingMode.ROUNDTOZERO: lambda a: np.trunc(a),
+        RoundingMode.ROUNDFROMZERO: lambda a: np.copysign(np.ceil(np.abs(a)), a),
+        RoundingMode.ROUNDHALFEVEN: lambda a: np.rint(a),
+        RoundingMode.ROUNDHALFODD: _roundhalfodd_float_array,
+        RoundingMode.ROUNDHALFDOWN: lambda a: _roundhalf_float_array(a, np.ceil, -0.5, False),
+        RoundingMode.ROUNDHALFUP: lambda a: _roundhalf_float_array(a, np.floor, 0.5, False),
+        RoundingMode.ROUNDHALFTOZERO: lambda a: _roundhalf_float_array(a, np.ceil, -0.5, True),
+        RoundingMode.ROUNDHALFFROMZERO: lambda a: _roundhalf_float_array(a, np.floor, 0.5, True),
+        RoundingMode.ROUND05FROMZERO: _round05fromzero_float_array
+    }
+    "Map of `RoundingMode`s to functions from NumPy float arrays to NumPy float arrays, vectorized counterparts of `_float_to_float`."
+
+    _real_to_integral_array = _map_over_dict_vals(_to_int64_array, _float_to_float_array)
+    "Map of `RoundingMode`s to functions from NumPy float arrays to NumPy `int64` arrays, vectorized counterparts of `_real_to_integral`."
+
+    _complex_to_complex_array = _map_over_dict_vals(lambda f: lambda a: f(a.real).astype(a.dtype), _float_to_float_array)
+    """Map of `RoundingMode`s to functions from NumPy complex arrays to NumPy complex arrays. As for `complex` numbers, the real parts are
+    rounded and the imaginary parts are zeroed, so the real parts are rounded in a single vectorized pass over the `a.real` view."""
+
+    _complex_to_integral_array = _map_over_dict_vals(_apply_to_real_part, _real_to_integral_array)
+    "Map of `RoundingMode`s to functions from NumPy complex arrays to NumPy `int64` arrays of their rounded real parts."
 
     def __init__(self, number_type: Number | type[Number], default_mode: RoundingMode = RoundingMode.ROUNDHALFEVEN):
         """Initialise a `Rounder` instance with
@@ -681,13 +1018,7 @@ class Rounder():
 
         # set raise_notimplemented, for unimplemented combinations of types and rounding methods
         # non-Number types raise a TypeError, but unsupported Number types just assign to raise_notimplemented
-        if issubclass(number_type, Number) and not issubclass(number_type, Complex | Decimal):
-            not_impl_msg = f'Number subclass {number_type.__name__} is not implemented in {type(self).__name__}'
-            self.raise_notimplemented = lambda x, msg = not_impl_msg: Rounder._raise_notimplemented(x, msg = msg)
-        elif not issubclass(number_type, Number):
-            raise TypeError(f'{number_type.__name__} is not a subclass of Number')
-        else:
-            self.raise_notimplemented = Rounder._raise_notimplemented
+        self.raise_notimplemented = self._raise_notimplemented_selector(number_type)
 
         # number_type is intended to be read-only
         self._number_type = number_type
@@ -695,44 +1026,22 @@ class Rounder():
         # isinteger can be reassigned but starts with the _isinteger_selector provided function
         self.isinteger = Rounder._isinteger_selector(number_type)
 
-        ## define roundingfuncs as a pair of default dictionaries with raise_notimplemented as default, and then add to them according to number_type
-        self._roundingfuncs = [defaultdict(
-            lambda: self.raise_notimplemented), defaultdict(lambda: self.raise_notimplemented)]
+        ## define roundingfuncs as a pair of plain dictionaries, copied from the dictionaries of rounding functions for number_type which are built
+        ## once per type and shared between instances; modes missing from them are looked up as raise_notimplemented
+        funcs, funcs_to_int, arrayfuncs, arrayfuncs_to_int = Rounder._build_for(number_type)
+        self._roundingfuncs = [dict(funcs), dict(funcs_to_int)]
 
-        # functions rounding to integer
-        if issubclass(number_type, Real | Decimal):
-            self._roundingfuncs[1] |= Rounder._real_to_integral
+        # vectorized functions used in place of roundingfuncs when x is a NumPy array, or None where there are none
+        self._arrayfuncs = [None if arrayfuncs is None else dict(arrayfuncs),
+                            None if arrayfuncs_to_int is None else dict(arrayfuncs_to_int)]
 
-        elif issubclass(number_type, Complex):
-            self._roundingfuncs[1] |= _map_over_dict_vals(
-                _apply_to_real_part, Rounder._real_to_integral)
-
-        # functions rounding to integer member of number_type
-        if issubclass(number_type, float):
-            self._roundingfuncs[0] |= Rounder._float_to_float if number_type == float else _map_over_dict_vals(
-                self._to_number_type, Rounder._float_to_float)
+        # exact functions rounding the quotient of two ints, used by countunits in place of roundingfuncs, or None where there are none
+        self._intquotientfuncs = [Rounder._int_quotient_to_integral if number_type == int else None] * 2
 
-        elif issubclass(number_type, Decimal):
-            self._roundingfuncs[0] |= Rounder._decimal_to_decimal if number_type == Decimal else _map_over_dict_vals(
-                self._to_number_type, Rounder._decimal_to_decimal)
-
-        elif issubclass(number_type, Real):
-            # if number_type is an instance of ABCMeta then it has no concrete implementation, so we need to skip
-            # assigning a rounding method returning the same type and instead leave it as the default value of
-            # raise_notimplemented
-            if not isinstance(number_type, abc.ABCMeta):
-              self._roundingfuncs[0] |= _map_over_dict_vals(
-                  self._to_number_type, Rounder._real_to_integral)
-
-        elif issubclass(number_type, complex):
-            self._roundingfuncs[0] |= _map_over_dict_vals(
-                lambda f: self._to_number_type(_apply_to_real_part(f)), Rounder._float_to_float)
-
-        elif issubclass(number_type, Complex):
-            # see the comments for the Real case above, which apply here as well
-            if not isinstance(number_type, abc.ABCMeta):
-              self._roundingfuncs[0] |= _map_over_dict_vals(lambda f: self._to_number_type(
-                  _apply_to_real_part(f)), Rounder._real_to_integral)
+        # whether roundunits, countunits and isunitsized can skip dividing x by an int unit size of one, see _isunitone; only for these
+        # exact types is r(x) sure to have the type of r(x / 1) * 1, since Decimal x / 1 rounds to the context precision and a subclass's
+        # x / 1 may not keep the subclass
+        self._unitshortcut = number_type in (int, float, complex, Fraction)
 
         # records the default mode and finishes the definition of roundingfuncs
         self.default_mode = default_mode
@@ -781,6 +1090,9 @@ class Rounder():
         holds the rounding functions, indexed by `RoundingMode`, that round to numbers which are `Integer`.
 
         Numerically we should have `roundingfuncs[0][mode](x) == roundingfuncs[1][mode](x)`, the difference being only in the type returned.
+
+        The dictionaries are plain `dict`s unless `setroundingfuncs` was given a `default` generator, so indexing them at a `RoundingMode` with no
+        rounding function raises `KeyError`. The operations of the `Rounder` instance call `self.raise_notimplemented` instead.
         """
         return self._roundingfuncs
 
@@ -790,14 +1102,19 @@ class Rounder():
         `default`. Also sets `self.roundingfuncs[to_int][None]` to return the same value as `self.roundingfuncs[to_int][self.default_mode]` so that
         the dictionary can be indexed by `None` in order to get the default `RoundingMode`.
 
-        If `default` is `NotImplemented` then the default generator for the `defaultdict` is set to be `lambda: self.raise_notimplemented`.
+        If `default` is `NotImplemented` then `d` is copied into a plain `dict` instead, and `RoundingMode`s missing from `d` call
+        `self.raise_notimplemented`.
+
+        Any vectorized functions for NumPy arrays, and the exact functions `countunits` uses on two `int`s, are dropped for `to_int`, so that
+        those arguments are passed to the functions in `d` as well.
 
         We don't use a setter for the property `roundingfuncs` since there are multiple input parameters required.
         """
-        if default is NotImplemented:
-            default = lambda: self.raise_notimplemented
-        self._roundingfuncs[to_int] = defaultdict(default, d)
-        self._roundingfuncs[to_int][None] = self._roundingfuncs[to_int][self._default_mode]
+        self._arrayfuncs[to_int] = None
+        self._intquotientfuncs[to_int] = None
+        self._roundingfuncs[to_int] = dict(d) if default is NotImplemented else defaultdict(default, d)
+        self._roundingfuncs[to_int][None] = self._roundingfunc(self._default_mode, to_int)
+        self._current = (self._roundingfuncs[0][None], self._roundingfuncs[1][None])
         return self._roundingfuncs
 
     @property
@@ -811,10 +1128,16 @@ class Rounder():
         `self.default_mode` must be set to a `RoundingMode`. Setting `self.default_mode` also updates
         `self.roundingfuncs[b][None] = self.roundingfuncs[b][self.default_mode]` for `b = 0, 1`, so that indexing into the `roundingfuncs` dictionaries at
         `None` gives the rounding function for the new default `RoundingMode`.
+
+        The pair of default rounding functions is also cached as `self._current`, which `self(x)` uses to skip the dictionary lookups when
+        no `RoundingMode` is supplied.
         """
         self._default_mode = mode
-        self._roundingfuncs[0][None] = self._roundingfuncs[0][mode]
-        self._roundingfuncs[1][None] = self._roundingfuncs[1][mode]
+        self._current = (self._roundingfunc(mode, False), self._roundingfunc(mode, True))
+        self._roundingfuncs[0][None], self._roundingfuncs[1][None] = self._current
+        for arrayfuncs in self._arrayfuncs:
+            if arrayfuncs is not None:
+                arrayfuncs[None] = arrayfuncs.get(mode, self.raise_notimplemented)
 
     ## operations
 
@@ -823,8 +1146,105 @@ class Rounder():
         
         * `x`: the element of type `t` to be rounded
         * `mode`: the `RoundingMode` to use (defaults to `None`, which selects the default `RoundingMode`, `self.default_mode`)
-        * `to_int`: whether to round to an integer element of `t` (`False`, the default) or to an `Integral` number (`True`)"""
-        return self._roundingfuncs[to_int][mode](x)
+        * `to_int`: whether to round to an integer element of `t` (`False`, the default) or to an `Integral` number (`True`)
+
+        When `x` is a NumPy array and `t` is a float or complex type, `x` is rounded elementwise by vectorized NumPy functions, rounding
+        the real parts of a complex array. The result keeps the float dtype of `x`, such as `float32`. With `to_int` the result is an
+        `int64` array, so each rounded element must be finite and in the range of `int64`.
+
+        #### Examples
+        >>> Rounder(float)(np.array([-2.5, -0.5, 0.5, 1.5]), RoundingMode.ROUNDHALFUP)
+        array([-2., -0.,  1.,  2.])
+        >>> Rounder(float)(np.array([-2.5, -0.5, 0.5, 1.5]), RoundingMode.ROUNDHALFUP, to_int=True)
+        array([-2,  0,  1,  2])
+        >>> Rounder(float)(np.array([8388609.0, 2.5], np.float32), RoundingMode.ROUNDHALFUP).tolist()
+        [8388609.0, 3.0]
+        >>> Rounder(complex)(np.array([2.5+1j, -0.5-2j]), RoundingMode.ROUNDHALFUP)
+        array([ 3.+0.j, -0.+0.j])
+        >>> Rounder(complex)(np.array([2.5+1j, -0.5-2j]), RoundingMode.ROUNDHALFUP, to_int=True)
+        array([3, 0])
+        """
+        if isinstance(x, _ndarray) and self._arrayfuncs[to_int] is not None:
+            funcs = self._arrayfuncs[to_int]
+        elif mode is None:
+            # indexing the `_current` tuple is measurably cheaper than looking up `None` in `funcs`, so this branch pays for itself
+            return self._current[to_int](x)
+        else:
+            funcs = self._roundingfuncs[to_int]
+
+        # as in `_roundingfunc`, but inlined on this hot path
+        try:
+            f = funcs[mode]
+        except KeyError:
+            f = self.raise_notimplemented
+        return f(x)
+
+    def specialize(self, mode: RoundingMode | None = None, to_int: bool = False) -> Callable[[Number], Number]:
+        """Returns the rounding function that `self(x, mode, to_int)` would call, for calling directly in a loop where `mode` and `to_int`
+        don't change.
+
+        * `mode`: the `RoundingMode` to use (defaults to `None`, which selects the current default `RoundingMode`, `self.default_mode`)
+        * `to_int`: whether to round to an integer element of `t` (`False`, the default) or to an `Integral` number (`True`)
+
+        The function is looked up once, so later changes to `self.default_mode` or `self.roundingfuncs` don't affect it. NumPy arrays aren't
+        given the vectorized treatment of `__call__`.
+
+        #### Examples
+        >>> r = Rounder(float)
+        >>> f = r.specialize(RoundingMode.ROUNDHALFUP)
+        >>> [f(x) for x in (-2.5, -0.5, 0.5, 1.5)]
+        [-2.0, -0.0, 1.0, 2.0]
+        >>> g = r.specialize(to_int=True)
+        >>> r.default_mode = RoundingMode.ROUNDUP
+        >>> g(2.5), r(2.5, to_int=True)
+        (2, 3)
+        """
+        return self._roundingfunc(self._default_mode if mode is None else mode, to_int)
+
+    def round_many(self, xs, mode: RoundingMode | None = None, to_int: bool = False) -> 'list | np.ndarray':
+        """Round each element of the iterable `xs` as `self(x, mode, to_int)` does, returning a list of the results. The rounding function
+        is looked up once for all of `xs`, as in `specialize`.
+
+        A NumPy array `xs` is rounded to a NumPy array instead: by the vectorized functions used by `self(xs, mode, to_int)` if there are
+        any, and otherwise elementwise to an array of `object` dtype.
+
+        #### Examples
+        >>> Rounder(Decimal).round_many([Decimal('2.5'), Decimal('-0.5'), Decimal('7.25')], RoundingMode.ROUNDHALFUP)
+        [Decimal('3'), Decimal('-0'), Decimal('7')]
+        >>> Rounder(Fraction).round_many(np.array([Fraction(5, 2), Fraction(-7, 3)], dtype=object), to_int=True)
+        array([2, -2], dtype=object)
+        """
+        if isinstance(xs, _ndarray):
+            if self._arrayfuncs[to_int] is not None:
+                return self(xs, mode, to_int)
+            return np.frompyfunc(self.specialize(mode, to_int), 1, 1)(xs)
+        return list(map(self.specialize(mode, to_int), xs))
+
+    def round_array(self, x: 'np.ndarray', mode: RoundingMode | None = None, to_int: bool = False) -> 'np.ndarray':
+        """Round the NumPy `float64` array `x` elementwise as `self(x, mode, to_int)` does, but with Numba compiled ufuncs which split the
+        elements of `x` across threads. Each ufunc is compiled the first time its `RoundingMode` is used, which takes around a second, so
+        this is meant for large arrays.
+
+        Falls back to `self(x, mode, to_int)` when Numba isn't installed, when `x` isn't a `float64` array, or when `self` has no vectorized
+        rounding functions for `to_int`.
+
+        #### Examples
+        >>> Rounder(float).round_array(np.array([-2.5, -0.5, 0.5, 1.5]), RoundingMode.ROUNDHALFUP)
+        array([-2., -0.,  1.,  2.])
+        >>> Rounder(float).round_array(np.array([-2.5, -0.5, 0.5, 1.5]), RoundingMode.ROUNDHALFUP, to_int=True)
+        array([-2,  0,  1,  2])
+        """
+        mode = self._default_mode if mode is None else mode
+        rounder_numba = _import_rounder_numba()
+        if (rounder_numba is None or not isinstance(x, _ndarray) or x.dtype != np.float64 or self._arrayfuncs[to_int] is None
+                or mode not in Rounder._float_to_float):
+            return self(x, mode, to_int)
+
+        # the Numba kernels have the same names as the `_float_to_float` functions they compile
+        f = rounder_numba._parallel_ufunc(Rounder._float_to_float[mode].__name__)
+        # as in `_round05fromzero_float_array`, infinite elements make invalid intermediate operations without affecting the result
+        with np.errstate(invalid='ignore'):
+            return _to_int64_array(f)(x) if to_int else f(x)
 
     def roundunits(self, x: Number, unitsize: Number, mode: RoundingMode | None = None, to_int: bool = False, free_type: bool = True) -> Number:
         """
@@ -840,11 +1260,55 @@ class Rounder():
 
         If `free_type` is `True` then the intermediate value `y` is returned. The type of `y` will depend on the types of `x` and `unitsize` as well as the choice of 
         `to_int`. If `free_type` is `False`, then we return `type(unitsize)(y)` when `to_int` is `True`, and otherwise we return `self.number_type(y)`.
+
+        If `self.number_type` is exactly `int`, `float`, `complex` or `Fraction`, `unitsize` is the `int` one and `x` already has type
+        `self.number_type`, then the division and multiplication by `unitsize` are skipped and `y = r(x)`, which has the same type as
+        `r(x / 1) * 1`. For an `int` `Rounder` this is also exact where the `float` `x / 1` is not. `Decimal` is excluded, since `x / 1`
+        rounds to the precision of the `decimal` context, as `x / Decimal(1)` does, and so are subclasses, whose `x / 1` may not keep the
+        subclass.
+
+        A NumPy array `x` is rounded elementwise as by `__call__`, and with `free_type` `False` the result array is converted with `astype`.
+        `unitsize` may also be an array, which is broadcast against `x`, e.g. to round each column of a 2-D `x` to its own unit size. As for
+        a scalar `unitsize`, elements with a zero unit size are left as they are.
+
+        #### Examples
+        >>> Rounder(int).roundunits(10**20 + 1, 1)
+        100000000000000000001
+        >>> Rounder(float).roundunits(-0.5, 1, RoundingMode.ROUNDHALFTOZERO)
+        -0.0
+        >>> Rounder(float).roundunits(3, 1, RoundingMode.ROUNDHALFEVEN)
+        3.0
+        >>> Rounder(float).roundunits(10**20 + 1, 1, RoundingMode.ROUNDHALFUP)
+        1e+20
+        >>> Rounder(float).roundunits(np.array([0.3, 0.4, -1.2]), 0.25, RoundingMode.ROUNDHALFUP)
+        array([ 0.25,  0.5 , -1.25])
+        >>> Rounder(float).roundunits(np.array([[0.3, 0.3, 0.3], [1.7, 1.7, 1.7]]), np.array([0.25, 1.0, 0.0]))
+        array([[0.25, 0.  , 0.3 ],
+               [1.75, 2.  , 1.7 ]])
         """
-        y = x if unitsize == 0 else self._roundingfuncs[to_int][mode](
-            x / unitsize) * unitsize
+        if isinstance(unitsize, _ndarray):
+            zero = unitsize == 0
+            # divide by one where the unit size is zero, so that no infinities or NaNs reach the rounding function
+            u = np.where(zero, 1, unitsize)
+            y = np.where(zero, x, self(x / u, mode, to_int) * u)
+            return y if free_type else y.astype(unitsize.dtype if to_int else self._number_type)
+
+        if isinstance(x, _ndarray):
+            f = lambda y: self(y, mode, to_int)
+        else:
+            # as in `__call__`, the default mode's functions are held directly in `self._current`
+            f = self._current[to_int] if mode is None else self._roundingfunc(mode, to_int)
+        if unitsize == 0:
+            y = x
+        elif self._isunitone(x, unitsize):
+            y = f(x)
+        else:
+            y = f(x / unitsize) * unitsize
 
-        return y if free_type else (type(unitsize) if to_int else self._number_type)(y)
+        if free_type:
+            return y
+        t = type(unitsize) if to_int else self._number_type
+        return y.astype(t) if isinstance(y, _ndarray) else t(y)
 
     def round(self, x: Number, ndigits: int | None = None, mode: RoundingMode | None = None) -> Number:
         """
@@ -861,7 +1325,11 @@ class Rounder():
         In a `Rounder` instance, when `ndigits` is an `int`, `x` is rounded to the nearest multiple of `10**(-ndigits)` using rounding method `mode`. The type of the rounded
         value will be `self.number_type`. If `mode` is `None` the default rounding method `self.default_mode` is used.
         """
-        return self(x, mode, True) if ndigits is None else self.roundunits(x, self._number_type(10)**(-ndigits), mode, False, False)
+        if ndigits is None:
+            return self(x, mode, True)
+        # a `float` power is cheaper than looking it up in the cache
+        unitsize = 10.0 ** -ndigits if self._number_type is float else Rounder._ndigits_unitsize(self._number_type, ndigits)
+        return self.roundunits(x, unitsize, mode, False, False)
 
     def countunits(self, x: Number, unitsize: Number, mode: RoundingMode | None = None, to_int: bool = True) -> Number:
         """
@@ -873,21 +1341,220 @@ class Rounder():
 
         Note that, unlike with method `roundunits`, there is no sensible way to calculate `countunits` when `unitsize` is zero. Passing a zero `unitsize`
         may result in a `ZeroDivisionError` or `OverflowError` being thrown. See the discussion on rounding `NaN` and infinite values in the `Rounder` docstring.
+
+        A NumPy array `x` is counted elementwise as by `__call__`, and an array `unitsize` is broadcast against `x`.
+
+        As in `roundunits`, if `unitsize` is the `int` one and `x` already has type `self.number_type`, which is exactly `int`, `float`,
+        `complex` or `Fraction`, then the division is skipped and `x` is rounded directly. For an `int` `Rounder`,
+        if `x` and `unitsize` are both `int` and `x` is too large for the `float` quotient `x / unitsize` to round correctly, the count is
+        made exactly from `divmod(x, unitsize)` instead.
+
+        #### Examples
+        >>> Rounder(float).countunits(np.array([0.3, 0.4, -1.2]), 0.25, RoundingMode.ROUNDHALFUP)
+        array([ 1,  2, -5])
+        >>> Rounder(float).countunits(3, 1, RoundingMode.ROUNDHALFEVEN, to_int=False)
+        3.0
+        >>> Rounder(int).countunits(10**20 + 1, 1, RoundingMode.ROUNDHALFEVEN)
+        100000000000000000001
+        >>> Rounder(int).countunits(10**20 + 1, 2, RoundingMode.ROUNDUP)
+        50000000000000000001
         """
-        return self._roundingfuncs[to_int][mode](x / unitsize)
+        if isinstance(x, _ndarray) or isinstance(unitsize, _ndarray):
+            return self(x / unitsize, mode, to_int)
+        f = self._current[to_int] if mode is None else self._roundingfunc(mode, to_int)
+        if type(unitsize) is int:
+            if self._isunitone(x, unitsize):
+                return f(x)
+            # below `_FLOAT_INTEGRAL_BOUND` in magnitude, the error in the `float` quotient is too small to move it across an integer or
+            # half integer, so only larger `x` need the slower exact count
+            if type(x) is int and abs(x) >= _FLOAT_INTEGRAL_BOUND and self._intquotientfuncs[to_int] is not None:
+                # a mode with no function raises as `f` would, as in `_roundingfunc`
+                try:
+                    q = self._intquotientfuncs[to_int][self._default_mode if mode is None else mode]
+                except KeyError:
+                    return self.raise_notimplemented(x)
+                return q(x, unitsize)
+        return f(x / unitsize)
 
     def isunitsized(self, x: Number, unitsize: Number) -> bool:
+        """
+        Returns whether `x` is an integer multiple of `unitsize`, i.e. whether `self.isinteger(x / unitsize)`. Every `x` is taken to be a
+        multiple of a zero `unitsize`.
+
+        If `x` and `unitsize` are both `int`, the test is made exactly as `x % unitsize == 0` instead, since `x / unitsize` is a `float`
+        and may be inexact. If only `unitsize` is the `int` one and `x` already has type `self.number_type`, which is exactly
+        `float`, `complex` or `Fraction`, then as in `roundunits` the division is skipped and `self.isinteger(x)` is returned.
+
+        For a `float` or `complex` `Rounder`, NumPy arrays `x` or `unitsize` are tested elementwise, broadcasting `unitsize` against `x`.
+
+        #### Examples
+        >>> Rounder(int).isunitsized(7, 3)
+        False
+        >>> Rounder(float).isunitsized(10**20 + 1, 3)
+        False
+        >>> Rounder(float).isunitsized(0.75, 0.25)
+        True
+        >>> Rounder(float).isunitsized(2.5, 1)
+        False
+        >>> Rounder(float).isunitsized(np.array([0.75, 0.8]), np.array([0.25, 0.0]))
+        array([ True,  True])
+        """
+        if (isinstance(x, _ndarray) or isinstance(unitsize, _ndarray)) and self._arrayfuncs[0] is not None:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                q = x / unitsize
+                isint = (q.imag == 0) & _isinteger_float_array(q.real) if np.iscomplexobj(q) else _isinteger_float_array(q)
+            return (np.asarray(unitsize) == 0) | isint
+
         if unitsize == 0:
             return True
 
+        if type(unitsize) is int:
+            if type(x) is int:
+                return not x % unitsize
+            if self._isunitone(x, unitsize):
+                return self._isinteger(x)
+
         return self._isinteger(x / unitsize)
     
     ## internal helpers
 
-    def _to_number_type(self, f: Callable[[Number], Number]) -> Callable[[Number], Number]:
-        return lambda x: self._number_type(f(x))
+    def _isunitone(self, x: Number, unitsize: Number) -> bool:
+        """
+        Returns whether `roundunits`, `countunits` and `isunitsized` can use `x` in place of `x / unitsize`: when `unitsize` is the `int`
+        one, `x` has type `self.number_type`, and that is exactly `int`, `float`, `complex` or `Fraction`.
+
+        #### Examples
+        >>> Rounder(int)._isunitone(10**20 + 1, 1)
+        True
+        >>> Rounder(float)._isunitone(3, 1)
+        False
+        >>> Rounder(Decimal)._isunitone(Decimal('2.5'), 1)
+        False
+        """
+        return self._unitshortcut and type(unitsize) is int and unitsize == 1 and type(x) is self._number_type
+
+    def _roundingfunc(self, mode: RoundingMode | None, to_int: bool) -> Callable[[Number], Number]:
+        """
+        Returns the rounding function `self.roundingfuncs[to_int][mode]`, or `self.raise_notimplemented` when there is no rounding function
+        for `mode`.
+
+        #### Examples
+        >>> Rounder(float)._roundingfunc(RoundingMode.ROUNDUP, True) is ceil
+        True
+        >>> Rounder(Real)._roundingfunc(RoundingMode.ROUNDUP, False)(1.5)
+        Traceback (most recent call last):
+          ...
+        NotImplementedError
+        """
+        try:
+            return self._roundingfuncs[to_int][mode]
+        except KeyError:
+            return self.raise_notimplemented
+
+    _builder_cache: Dict[type, tuple] = {}
+    "Cache of the results of `_build_for`, keyed by `Number` subclass."
+
+    @classmethod
+    def _build_for(cls, number_type: type[Number]) -> tuple:
+        """
+        Returns the tuple `(funcs, funcs_to_int, arrayfuncs, arrayfuncs_to_int)` of dictionaries of rounding functions, indexed by
+        `RoundingMode`, for the `Number` subclass `number_type`. `funcs` and `funcs_to_int` are the entries for `roundingfuncs[0]` and
+        `roundingfuncs[1]` respectively, and `arrayfuncs` and `arrayfuncs_to_int` hold the vectorized functions for NumPy arrays rounding to
+        integral elements of `number_type` and to integers respectively, or are `None` if there are none.
+
+        The functions depend only on `number_type`, so the result is built once per type and memoized in `cls._builder_cache`. The dictionaries
+        are shared and must not be modified; `Rounder` instances copy them into their own dictionaries.
+        """
+        try:
+            return cls._builder_cache[number_type]
+        except KeyError:
+            pass
+
+        funcs, funcs_to_int, arrayfuncs, arrayfuncs_to_int = {}, {}, None, None
+        to_number_type = lambda f: Rounder._to_number_type(number_type, f)
+        real_part_to_number_type = lambda f: Rounder._real_part_to_number_type(number_type, f)
+
+        # functions rounding to integer
+        if issubclass(number_type, Decimal):
+            funcs_to_int = Rounder._decimal_to_integral
+
+        elif number_type == int:
+            funcs_to_int = Rounder._int_to_integral
+
+        elif issubclass(number_type, Real):
+            funcs_to_int = Rounder._real_to_integral
+
+        elif issubclass(number_type, Complex):
+            funcs_to_int = _map_over_dict_vals(_apply_to_real_part, Rounder._real_to_integral)
+
+        # functions rounding to integer member of number_type
+        if issubclass(number_type, float):
+            funcs = Rounder._float_to_float if number_type == float else _map_over_dict_vals(
+                to_number_type, Rounder._float_to_float)
+
+        elif issubclass(number_type, Decimal):
+            funcs = Rounder._decimal_to_decimal if number_type == Decimal else _map_over_dict_vals(
+                to_number_type, Rounder._decimal_to_decimal)
+
+        elif issubclass(number_type, Real):
+            # if number_type is an instance of ABCMeta then it has no concrete implementation, so we need to skip
+            # assigning a rounding method returning the same type and instead leave it as the default value of
+            # raise_notimplemented
+            if not isinstance(number_type, abc.ABCMeta):
+              # the functions rounding to integer already return `int`, so there's no need to wrap them for `int` itself
+              funcs = Rounder._int_to_integral if number_type == int else _map_over_dict_vals(
+                  to_number_type, Rounder._real_to_integral)
+
+        elif issubclass(number_type, complex):
+            funcs = _map_over_dict_vals(real_part_to_number_type, Rounder._float_to_float)
+
+        elif issubclass(number_type, Complex):
+            # see the comments for the Real case above, which apply here as well
+            if not isinstance(number_type, abc.ABCMeta):
+              funcs = _map_over_dict_vals(real_part_to_number_type, Rounder._real_to_integral)
+
+        # vectorized functions for NumPy float arrays
+        if np is not None and issubclass(number_type, float | np.floating):
+            arrayfuncs, arrayfuncs_to_int = Rounder._float_to_float_array, Rounder._real_to_integral_array
+
+        elif np is not None and issubclass(number_type, complex | np.complexfloating):
+            arrayfuncs, arrayfuncs_to_int = Rounder._complex_to_complex_array, Rounder._complex_to_integral_array
+
+        cls._builder_cache[number_type] = funcs, funcs_to_int, arrayfuncs, arrayfuncs_to_int
+        return funcs, funcs_to_int, arrayfuncs, arrayfuncs_to_int
 
     @staticmethod
+    def _to_number_type(number_type: type[Number], f: Callable[[Number], Number]) -> Callable[[Number], Number]:
+        return lambda x: number_type(f(x))
+
+    @staticmethod
+    def _real_part_to_number_type(number_type: type[Complex], f: Callable[[Real], Number]) -> Callable[[Complex], Number]:
+        """As `_to_number_type(number_type, _apply_to_real_part(f))`, but fused into a single function, saving a call per rounding.
+
+        #### Examples
+        >>> Rounder._real_part_to_number_type(complex, _roundhalfup_float)(2.5 - 3j)
+        (3+0j)
+        """
+        return lambda x: number_type(f(x.real))
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _ndigits_unitsize(number_type: type[Number], ndigits: int) -> Number:
+        """
+        Returns the unit size `number_type(10)**(-ndigits)` that `round` rounds to. Making it is comparatively slow for `Decimal` and
+        `Fraction`, so it is memoized. The `Decimal` powers of ten are exact within the exponent limits of the `decimal` context, so the
+        memoized values don't depend on its precision.
+
+        #### Examples
+        >>> Rounder._ndigits_unitsize(Decimal, 2)
+        Decimal('0.01')
+        >>> Rounder._ndigits_unitsize(Fraction, -3)
+        Fraction(1000, 1)
+        """
+        return number_type(10)**(-ndigits)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
     def _isinteger_selector(t: type[Number]) -> Callable[[Number], bool] | None:
         """
         Returns an "isinteger" type function for the `Number` subclass `t`. `t` is checked to be a subclass of
@@ -898,6 +1565,17 @@ class Rounder():
         isinteger function for `Real` as it does not know about the isinteger method for the class of `t`.
         
         Returns `None` for a `Number` subclass which is not a subclass of `Decimal` or of `Complex`.
+
+        The checks on `t` are made once, here, so that the function returned does no type dispatch of its own. The function returned
+        depends only on `t`, so it is memoized and shared between `Rounder` instances.
+
+        #### Examples
+        >>> Rounder._isinteger_selector(Decimal)(Decimal('1E+100000'))
+        True
+        >>> Rounder._isinteger_selector(Decimal)(Decimal('1.5E-100000'))
+        False
+        >>> Rounder(float).isinteger is Rounder(float).isinteger
+        True
         """
         if issubclass(t, Integral):
             return lambda _: True
@@ -906,7 +1584,9 @@ class Rounder():
             return lambda x: x.is_integer()
 
         if issubclass(t, Decimal):
-            return lambda x: x.is_finite() and x.as_integer_ratio()[1] == 1
+            # `to_integral_value` is exact and signals neither `Inexact` nor `Rounded`, and unlike `as_integer_ratio` it doesn't build
+            # large integers for large exponents
+            return lambda x: x.is_finite() and x == x.to_integral_value()
 
         # nothing special for `Fraction` that's more specific than general `Rational`
         if issubclass(t, Rational):
@@ -928,6 +1608,38 @@ class Rounder():
 
         return lambda _: False
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _raise_notimplemented_selector(cls, t: type[Number]) -> Callable:
+        """
+        Returns the `raise_notimplemented` function for instances of `cls` with `number_type` `t`. For a `Number` subclass that is not a
+        subclass of `Decimal` or of `Complex` the function raises `NotImplementedError` with a message naming `t`, and otherwise it is
+        `Rounder._raise_notimplemented`.
+
+        Raises `TypeError` if `t` is not a subclass of `Number`.
+
+        The function returned depends only on `cls` and `t`, so it is memoized, which saves the subclass checks on every `Rounder` construction.
+
+        #### Examples
+        >>> Rounder._raise_notimplemented_selector(Number)(1)
+        Traceback (most recent call last):
+          ...
+        NotImplementedError: Number subclass Number is not implemented in Rounder
+        >>> Rounder._raise_notimplemented_selector(float) is Rounder._raise_notimplemented
+        True
+        >>> Rounder._raise_notimplemented_selector(str)
+        Traceback (most recent call last):
+          ...
+        TypeError: str is not a subclass of Number
+        """
+        if issubclass(t, Number) and not issubclass(t, Complex | Decimal):
+            not_impl_msg = f'Number subclass {t.__name__} is not implemented in {cls.__name__}'
+            return lambda x, msg = not_impl_msg: Rounder._raise_notimplemented(x, msg = msg)
+        elif not issubclass(t, Number):
+            raise TypeError(f'{t.__name__} is not a subclass of Number')
+        else:
+            return Rounder._raise_notimplemented
+
     @staticmethod
     def _raise_notimplemented(_ = None, msg = None):
         """Raises the `NotImplementedError` exception. The first argument is ignored. It is a placeholder for a value to be rounded,
@@ -952,6 +1664,16 @@ class Rounder():
 
 if __name__ == "__main__":
     import doctest
-    from fractions import Fraction
-    doctest.testmod()
-    doctest.testfile('../../tests/additional_doctests.md')
+    import sys
+
+    class _NoNumPyDocTestParser(doctest.DocTestParser):
+        "Drops the examples using NumPy, which is an optional dependency, so that the rest can be run without it."
+        def get_examples(self, string, name='<string>'):
+            return [example for example in super().get_examples(string, name) if 'np.' not in example.source]
+
+    parser = doctest.DocTestParser() if np is not None else _NoNumPyDocTestParser()
+    runner = doctest.DocTestRunner()
+    for test in doctest.DocTestFinder(parser=parser).find(sys.modules[__name__]):
+        runner.run(test)
+    runner.summarize()
+    doctest.testfile('../../tests/additional_doctests.md', parser=parser)
@@ -0,0 +1,208 @@
+"""Numba compiled counterparts of the `_*_float` rounding functions in `_rounder.py`.
+
+This module is optional and is only imported when Numba is installed and a compiled kernel is first needed, so that importing
+`roundingutils` stays fast. Each kernel is compiled for `float64(float64)` without `fastmath`, since halfway cases, signed zeros,
+Inf and NaN all need IEEE semantics. Numba doesn't support `math.modf` or `math.fmod`, so the kernels are written with the
+NumPy equivalents instead.
+
+Calling one of these kernels from Python costs about as much as calling the pure Python function it replaces, so they are intended
+to be called from other compiled code, such as loops over arrays. `_parallel_ufunc` builds such loops, as NumPy ufuncs.
+"""
+from functools import lru_cache
+
+import numpy as np
+from numba import njit, vectorize, float64
+
+if __package__:
+    from ._rounder import _FLOAT_BELOW_HALF, _FLOAT_INTEGRAL_BOUND
+else:
+    # run as a script, for the doctests
+    from _rounder import _FLOAT_BELOW_HALF, _FLOAT_INTEGRAL_BOUND
+
+# the kernels aren't cached to disk with `cache=True`, since a cache written when this module is imported from the package can't be
+# loaded when it is run as a script for its doctests, and the other way around
+_jit = njit(float64(float64), fastmath=False)
+
+
+@_jit
+def _ceil_float(x):
+    """As `_rounder._ceil_float`.
+
+    #### Examples
+    >>> _ceil_float(-3.2)
+    -3.0
+    >>> _ceil_float(-0.5) == -0.0 and copysign(1.0, _ceil_float(-0.5)) == -1.0
+    True
+    """
+    return np.ceil(x)
+
+
+@_jit
+def _floor_float(x):
+    """As `_rounder._floor_float`.
+
+    #### Examples
+    >>> _floor_float(-3.2)
+    -4.0
+    >>> _floor_float(0.5) == 0.0 and copysign(1.0, _floor_float(0.5)) == 1.0
+    True
+    """
+    return np.floor(x)
+
+
+@_jit
+def _trunc_float(x):
+    """As `_rounder._trunc_float`.
+
+    #### Examples
+    >>> _trunc_float(-3.2)
+    -3.0
+    >>> _trunc_float(-0.5) == -0.0 and copysign(1.0, _trunc_float(-0.5)) == -1.0
+    True
+    """
+    return np.trunc(x)
+
+
+@_jit
+def _awayfromzero_float(x):
+    """As `_rounder._awayfromzero_float`.
+
+    #### Examples
+    >>> _awayfromzero_float(-3.2)
+    -4.0
+    >>> _awayfromzero_float(1.0)
+    1.0
+    """
+    return np.copysign(np.ceil(np.fabs(x)), x)
+
+
+@_jit
+def _roundhalfeven_float(x):
+    """As `_rounder._roundhalfeven_float`.
+
+    #### Examples
+    >>> _roundhalfeven_float(-4.5)
+    -4.0
+    >>> _roundhalfeven_float(5.5)
+    6.0
+    """
+    return np.rint(x)
+
+
+@_jit
+def _roundhalfodd_float(x):
+    """As `_rounder._roundhalfodd_float`.
+
+    #### Examples
+    >>> _roundhalfodd_float(-4.5)
+    -5.0
+    >>> _roundhalfodd_float(5.5)
+    5.0
+    >>> _roundhalfodd_float(1.5000000000000002)
+    2.0
+    >>> _roundhalfodd_float(2.0 ** 53)
+    9007199254740992.0
+    """
+    # as `_rounder._roundhalfodd_float_array`, the odd neighbour is `r + 2.0 * d` rather than `2.0 * x - r`: unlike
+    # `_rounder._roundhalfodd_float` this kernel has no integral-bound guard, and `2.0 * x` can overflow for huge `x`, as the compiled
+    # conditional may evaluate both of its arms
+    r = np.rint(x)
+    d = x - r
+    return np.copysign(r + 2.0 * d if np.fabs(d) == 0.5 else r, x)
+
+
+@_jit
+def _roundhalftozero_float(x):
+    """As `_rounder._roundhalftozero_float`.
+
+    #### Examples
+    >>> _roundhalftozero_float(-3.5)
+    -3.0
+    >>> _roundhalftozero_float(0.5) == 0.0 and copysign(1.0, _roundhalftozero_float(0.5)) == 1.0
+    True
+    """
+    return np.copysign(np.ceil(np.fabs(x) - 0.5), x) if np.fabs(x) < _FLOAT_INTEGRAL_BOUND else x
+
+
+@_jit
+def _roundhalffromzero_float(x):
+    """As `_rounder._roundhalffromzero_float`.
+
+    #### Examples
+    >>> _roundhalffromzero_float(-3.5)
+    -4.0
+    >>> _roundhalffromzero_float(-0.25) == -0.0 and copysign(1.0, _roundhalffromzero_float(-0.25)) == -1.0
+    True
+    """
+    return np.copysign(np.floor(np.fabs(x) + _FLOAT_BELOW_HALF), x) if np.fabs(x) < _FLOAT_INTEGRAL_BOUND else x
+
+
+@_jit
+def _roundhalfdown_float(x):
+    """As `_rounder._roundhalfdown_float`.
+
+    #### Examples
+    >>> _roundhalfdown_float(-3.5)
+    -4.0
+    >>> _roundhalfdown_float(5.5)
+    5.0
+    >>> _roundhalfdown_float(-0.49999999999999994) == -0.0 and copysign(1.0, _roundhalfdown_float(-0.49999999999999994)) == -1.0
+    True
+    """
+    return np.copysign(np.ceil(x - (_FLOAT_BELOW_HALF if x < 0 else 0.5)), x) if np.fabs(x) < _FLOAT_INTEGRAL_BOUND else x
+
+
+@_jit
+def _roundhalfup_float(x):
+    """As `_rounder._roundhalfup_float`.
+
+    #### Examples
+    >>> _roundhalfup_float(-3.5)
+    -3.0
+    >>> _roundhalfup_float(-0.5) == -0.0 and copysign(1.0, _roundhalfup_float(-0.5)) == -1.0
+    True
+    >>> _roundhalfup_float(0.49999999999999994)
+    0.0
+    """
+    return np.copysign(np.floor(x + (_FLOAT_BELOW_HALF if x > 0 else 0.5)), x) if np.fabs(x) < _FLOAT_INTEGRAL_BOUND else x
+
+
+@_jit
+def _round05fromzero_float(x):
+    """As `_rounder._round05fromzero_float`.
+
+    #### Examples
+    >>> _round05fromzero_float(5.0000000000001)
+    6.0
+    >>> _round05fromzero_float(-7.0000000000001)
+    -7.0
+    >>> _round05fromzero_float(float('-Inf'))
+    -inf
+    >>> copysign(1.0, _round05fromzero_float(-0.0))
+    -1.0
+    """
+    ipart = np.trunc(x)
+    fpart = x - ipart
+    # branchless: the step away from zero is 1.0 or 0.0, and takes the sign of `x` so that adding a zero step keeps the sign of a zero
+    # `ipart`; for infinite x `fpart` is NaN rather than zero, but then `fmod(ipart, 5.0)` is NaN too so the step is still zero
+    step = np.float64((fpart != 0.0) & (np.fmod(ipart, 5.0) == 0.0))
+    return ipart + np.copysign(step, x)
+
+
+@lru_cache(maxsize=None)
+def _parallel_ufunc(name: str):
+    """Returns a NumPy ufunc applying the kernel named `name` elementwise to `float64` arrays. The ufunc is compiled on first use with
+    `target='parallel'`, so that the elements of large arrays are split across threads, which run without holding the GIL.
+
+    #### Examples
+    >>> _parallel_ufunc('_roundhalfup_float')(np.array([-2.5, -0.5, 0.5, 1.5]))
+    array([-2., -0.,  1.,  2.])
+    """
+    kernel = globals()[name]
+    return vectorize([float64(float64)], target='parallel')(lambda x: kernel(x))
+
+
+if __name__ == "__main__":
+    import doctest
+    from math import copysign
+    doctest.testmod()